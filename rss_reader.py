@@ -5,15 +5,9 @@ Textual-based RSS Feed Reader
 A rich terminal user interface for reading RSS feeds using the Textual library.
 """
 
-import rich
-from rich.text import Text
-from rich.panel import Panel
-from rich.table import Table
-from rich.console import Console
-
 import asyncio
 from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
+from textual.containers import Horizontal, Vertical, ScrollableContainer
 from textual.widgets import (
     Header,
     Footer,
@@ -24,22 +18,143 @@ from textual.widgets import (
     Input,
     Label,
     Markdown,
-    OptionList
 )
-from textual import events
+from textual import work
+from textual.content import Content
+from textual.message import Message
+from textual.worker import Worker, WorkerState, get_current_worker
 from textual.reactive import reactive
 from textual.screen import ModalScreen, Screen
-from textual.binding import Binding
-from textual.widgets.option_list import Option
-import feedparser
+try:
+    # lxml strips HTML in C and decodes entities properly; the regex fallback is used without it
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    from lxml.etree import ParserError
+except ImportError:
+    lxml_etree = lxml_html = None
+try:
+    # xxhash fingerprints feed bodies much faster than hashlib
+    import xxhash
+except ImportError:
+    xxhash = None
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import html
+import io
+import itertools
+import mmap
 import re
 import os
-from datetime import datetime
-from colorama import init, Fore, Style, Back
-import webbrowser
+import pickle
+import tempfile
+import threading
+import types
+import urllib.parse
+
+# The network and parsing libraries (aiohttp, requests, feedparser, colorama) are imported
+# where they are first used, so the UI can start before they have loaded
+
+# Network settings for the concurrent feed fetcher
+FETCH_TIMEOUT = 15  # seconds, per request
+SYNC_FETCH_TIMEOUT = 10  # seconds, for single-feed requests outside the fetcher
+FETCH_RETRIES = 3
+# Threads parsing downloaded feeds; kept low since every parse in progress holds a whole document tree
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+MAX_CONCURRENT_REQUESTS = 64  # default; TextualRSSReaderApp(max_concurrent_requests=...) overrides it
+
+# Size limit applied when parsing with feedparser-rs, to guard against huge or hostile feeds
+MAX_FEED_SIZE_BYTES = 50_000_000
+
+# Articles shown per feed; feeds are newest-first, so this keeps the recent ones
+MAX_ARTICLES = 100
+# Characters of raw summary HTML kept per article, so verbose feeds don't cost a full strip per entry
+MAX_SUMMARY_CHARS = 10_000
+
+# Parsed feeds by content hash of the raw body, for servers that don't support conditional GET
+_PARSE_CACHE = collections.OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()  # Feeds are parsed on several threads at once
+PARSE_CACHE_SIZE = 256
+
+# Conditional GET cache: feed URL -> {'etag': ..., 'modified': ..., 'parsed': ...}
+FEED_CACHE = {}
+FEED_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'rss_reader', 'feeds.pkl')
+
+# Markdown links in [text](url) format, capturing both the text and URL (matched on the raw file bytes)
+_MD_LINK_RE_BYTES = re.compile(rb'\[([^\]]+)\]\((https?://[^\s)]+)\)')
+# Hints that a URL is an RSS/Atom feed (covers .rss, /rss, /feed/, feedburner, atom.xml, ...)
+_RSS_HINT_RE = re.compile(r'(?i)rss|feed|atom|\.xml|campaign-archive')
+# HTML tags, stripped from article summaries. A tag can't contain '<' or '>', so each '<' is
+# scanned at most up to the next one and unclosed tags can't make the match backtrack
+_HTML_TAG_RE = re.compile(r'<[^<>]*>')
+
+# Feeds files already scanned: path -> ((mtime_ns, size), index)
+_FEEDS_FILE_CACHE = {}
+
+# Written at the top of a feeds file that doesn't have one yet
+FEEDS_FILE_HEADER = "# RSS Feeds\n\nThis file contains the list of RSS feeds for the terminal RSS reader.\n\n## Uncategorized\n"
+
+
+def _normalize_feed_url(feed_url):
+    """Reduce a feed URL to the form used for duplicate checks (case-insensitive host, no trailing slash)."""
+    feed_url = feed_url.strip()
+    try:
+        parts = urllib.parse.urlsplit(feed_url)
+    except ValueError:
+        # Malformed (e.g. an unclosed IPv6 bracket); compare it as written
+        return feed_url
+    return urllib.parse.urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, parts.fragment)
+    )
+
 
-# Initialize colorama
-init(autoreset=True)
+def _scan_feeds_file(file_path):
+    """
+    Read and index a feeds markdown file, reusing the previous result while the file is unchanged.
+
+    Args:
+        file_path (str): Path to the markdown file containing RSS feeds
+
+    Returns:
+        dict: 'feeds' (list of (feed_name, feed_url) tuples), 'urls' (set of every linked URL, normalized),
+        and 'has_header' / 'has_uncategorized' / 'uncategorized_is_last' / 'ends_with_newline' flags;
+        None if the file doesn't exist
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+
+    # Skip the read and regex pass when the file hasn't changed since the last call
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _FEEDS_FILE_CACHE.get(file_path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    index = {'feeds': [], 'urls': set(), 'has_header': False, 'has_uncategorized': False,
+             'uncategorized_is_last': False, 'ends_with_newline': True}
+    if st.st_size:
+        # Scan the page cache directly instead of copying and decoding the whole file into a str
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Single pass over the markdown links, keeping the likely RSS feed URLs
+            for match in _MD_LINK_RE_BYTES.finditer(mm):
+                name = match.group(1).decode('utf-8', errors='replace')
+                url = match.group(2).decode('utf-8', errors='replace')
+                index['urls'].add(_normalize_feed_url(url))
+                # Cheap string checks settle the common cases; only ambiguous URLs reach the regex
+                if url.endswith(('.rss', '.xml')) or '/feed' in url or '/rss' in url or _RSS_HINT_RE.search(url):
+                    index['feeds'].append((name, url))
+
+            index['has_header'] = mm.find(b"# RSS Feeds") != -1
+            uncategorized = mm.rfind(b"## Uncategorized")
+            index['has_uncategorized'] = uncategorized != -1
+            # New feeds can only be appended to the end of the file if that's where the section is
+            index['uncategorized_is_last'] = uncategorized != -1 and mm.find(b"\n## ", uncategorized) == -1
+            index['ends_with_newline'] = mm[-1:] == b"\n"
+
+    _FEEDS_FILE_CACHE[file_path] = (key, index)
+    return index
 
 
 def extract_feeds_from_markdown(file_path):
@@ -52,51 +167,275 @@ def extract_feeds_from_markdown(file_path):
     Returns:
         list: List of tuples containing (feed_name, feed_url)
     """
-    if not os.path.exists(file_path):
+    index = _scan_feeds_file(file_path)
+    if index is None:
         return []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Return list of (name, url) tuples
+    return list(index['feeds'])
 
-    # Find all markdown links that contain any URLs with names
-    # This pattern matches [text](url) format and captures both the text and URL
-    pattern = r'\[([^\]]+)\]\((https?://[^\s\)]+)\)'
-    all_matches = re.findall(pattern, content)
 
-    # Filter for likely RSS feed URLs
-    rss_matches = []
-    for name, url in all_matches:
-        if any(ext in url.lower() for ext in ['.rss', '.xml', 'feed', 'rss']) or \
-           any(pattern in url.lower() for pattern in ['rss', 'feed', 'atom']) or \
-           re.search(r'/feed/?$', url) or re.search(r'/rss/?$', url) or \
-           any(domain in url for domain in ['feedburner', 'campaign-archive']):
-            rss_matches.append((name, url))
+@functools.cache
+def _get_feedparser():
+    """Import the feed parser on first use, preferring feedparser-rs when it is installed."""
+    try:
+        # feedparser-rs is a drop-in, Rust-backed replacement that parses much faster
+        import feedparser_rs as feedparser
+    except ImportError:
+        import feedparser
+    return feedparser
 
-    # Return list of (name, url) tuples
-    return rss_matches
+
+@functools.cache
+def _http_session():
+    """Shared session for single-feed requests, so repeat requests reuse kept-alive connections."""
+    import requests
+    return requests.Session()
+
+
+@functools.cache
+def _parse_pool():
+    """Thread pool the concurrent fetcher parses feeds on, so parsing doesn't stall the downloads."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="feed-parse")
+
+
+# Root elements of the documents _parse_feed_fast understands: RSS 2.0, Atom and RSS 1.0 (RDF)
+_FAST_FEED_ROOTS = {'rss', 'feed', 'RDF'}
+# Entry child element (without namespace) -> field, in order of preference when several are present
+_FAST_FEED_FIELDS = {
+    'title': ('title',),
+    'published': ('pubDate', 'published', 'date', 'updated'),
+    'summary': ('description', 'summary', 'encoded', 'content'),
+}
+
+
+def _parse_feed_fast(body, max_items=MAX_ARTICLES):
+    """
+    Parse an RSS/Atom document with lxml, keeping only the fields the UI displays.
+
+    Unlike feedparser this doesn't sanitize or resolve anything; summaries are stripped to plain
+    text later anyway. Parsing stops after max_items entries.
+
+    Args:
+        body (bytes): The raw feed document
+        max_items (int): Number of entries to keep
+
+    Returns:
+        types.SimpleNamespace: Object with .feed.title and .entries, shaped like a feedparser result,
+        or None if the document isn't a well-formed feed (leave those to feedparser)
+    """
+    feed_title = None
+    entries = []
+    checked_root = False
+    try:
+        parser = lxml_etree.iterparse(io.BytesIO(body), events=('end',), resolve_entities=False, no_network=True)
+        for _, element in parser:
+            if not checked_root:
+                # Check the document type once, on the first complete element
+                root = element.getroottree().getroot()
+                if root.tag.rpartition('}')[2] not in _FAST_FEED_ROOTS:
+                    return None
+                checked_root = True
+
+            name = element.tag.rpartition('}')[2] if isinstance(element.tag, str) else None
+            if name == 'title' and feed_title is None:
+                parent = element.getparent()
+                if parent is not None and parent.tag.rpartition('}')[2] in ('channel', 'feed'):
+                    feed_title = ''.join(element.itertext()).strip() or None
+            elif name in ('item', 'entry'):
+                entries.append(_fast_entry(element))
+                # Drop the finished entry and everything before it, so memory stays flat
+                element.clear()
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+                if len(entries) >= max_items:
+                    break
+    except lxml_etree.XMLSyntaxError:
+        return None
+
+    return types.SimpleNamespace(feed=types.SimpleNamespace(title=feed_title), entries=entries)
+
+
+# An entry as _parse_feed_fast returns it: every field present (None if missing), summary still HTML
+_RawEntry = collections.namedtuple('_RawEntry', ['title', 'published', 'link', 'summary'])
+
+
+def _fast_entry(element):
+    """Pull the displayed fields out of an RSS <item> or Atom <entry> element."""
+    texts = {}
+    link = None
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue  # Comments and processing instructions
+        name = child.tag.rpartition('}')[2]
+        if name == 'link':
+            # Atom links carry the URL in an attribute rather than as text
+            href = child.get('href')
+            if href is None:
+                link = link or (child.text or '').strip() or None
+            elif child.get('rel', 'alternate') == 'alternate':
+                link = link or href
+        else:
+            if name == 'guid' and child.get('isPermaLink', 'true').lower() != 'true':
+                continue  # Only permalink guids stand in for a missing <link>, as in feedparser
+            texts.setdefault(name, ''.join(child.itertext()).strip())
+
+    fields = {
+        field: next((texts[name] for name in names if texts.get(name)), None)
+        for field, names in _FAST_FEED_FIELDS.items()
+    }
+    return _RawEntry(link=link or texts.get('guid') or None, **fields)
+
+
+def parse_feed(source):
+    """
+    Parse an RSS feed, keeping at most MAX_ARTICLES entries (and applying MAX_FEED_SIZE_BYTES when
+    feedparser-rs is in use).
+
+    Without feedparser-rs, raw bodies go through the lxml fast path first, and only documents it
+    can't handle fall through to the (much slower) pure-Python feedparser. Raw bodies are
+    memoized by content hash, so an unchanged body is only parsed once.
+
+    Args:
+        source: Feed URL, or the raw feed document as bytes
+
+    Returns:
+        dict: Parsed feed data
+    """
+    # A body we've already parsed (the server ignored our conditional GET) is looked up by hash
+    if isinstance(source, bytes):
+        if xxhash is not None:
+            digest = xxhash.xxh3_64_intdigest(source)
+        else:
+            digest = hashlib.blake2b(source, digest_size=8).digest()
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(digest)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(digest)
+                return cached
+
+    feedparser = _get_feedparser()
+    parsed = None
+    if hasattr(feedparser, 'parse_with_limits'):
+        # Entries past what the article list shows are never built
+        limits = feedparser.ParserLimits(max_entries=MAX_ARTICLES, max_feed_size_bytes=MAX_FEED_SIZE_BYTES)
+        parsed = feedparser.parse_with_limits(source, limits=limits)
+    elif isinstance(source, bytes) and lxml_etree is not None:
+        parsed = _parse_feed_fast(source)
+    if parsed is None:
+        parsed = feedparser.parse(source)
+        # feedparser always builds every entry; drop the ones that are never shown before the
+        # result is kept in the caches (and pickled to disk)
+        if len(parsed.entries) > MAX_ARTICLES:
+            parsed['entries'] = parsed.entries[:MAX_ARTICLES]
+
+    if isinstance(source, bytes):
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[digest] = parsed
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    return parsed
+
+
+def load_feed_cache(cache_file=FEED_CACHE_FILE):
+    """
+    Load the conditional GET cache saved by a previous run into FEED_CACHE.
+
+    Args:
+        cache_file (str): Path to the pickled cache
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            FEED_CACHE.update(pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        # A missing or unreadable cache just means every feed is fetched in full
+        pass
+
+
+def save_feed_cache(cache_file=FEED_CACHE_FILE, cache=None):
+    """
+    Save FEED_CACHE so the next run can send conditional requests.
+
+    Args:
+        cache_file (str): Path to the pickled cache
+        cache (dict): Snapshot of FEED_CACHE to save (optional, defaults to FEED_CACHE itself). Pass a
+            copy taken on the event loop when saving from another thread, since the loop keeps adding
+            feeds to FEED_CACHE while it is being pickled
+    """
+    try:
+        data = pickle.dumps(FEED_CACHE if cache is None else cache)
+    except (pickle.PicklingError, TypeError):
+        # Parsed feeds from some parser backends can't be pickled
+        return
+
+    # Write to a uniquely named temporary file and swap it in, so an interrupted save never leaves a
+    # truncated cache and concurrent saves (worker thread and shutdown) can't clobber each other
+    cache_dir = os.path.dirname(cache_file)
+    tmp_file = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, prefix='.feeds-', suffix='.tmp', delete=False) as f:
+            tmp_file = f.name
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+
+def _conditional_headers(feed_url):
+    """Build the request headers that let an unchanged feed come back as 304 Not Modified."""
+    cached = FEED_CACHE.get(feed_url, {})
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('modified'):
+        headers['If-Modified-Since'] = cached['modified']
+    return headers
+
+
+def _cache_feed(feed_url, etag, modified, parsed):
+    """Remember the validators and parsed data of a freshly downloaded feed."""
+    FEED_CACHE[feed_url] = {'etag': etag, 'modified': modified, 'parsed': parsed}
+    return parsed
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_valid_feed(feed_url):
+    """Download and parse a feed, raising ValueError if it isn't one (so failures aren't cached)."""
+    response = _http_session().get(feed_url, timeout=SYNC_FETCH_TIMEOUT)
+    feed = parse_feed(response.content)
+    # Check if parsing was successful and contains feed data
+    if feed and hasattr(feed, 'feed') and getattr(feed.feed, 'title', None):
+        return feed
+    raise ValueError(f"Not an RSS feed: {feed_url}")
 
 
 def validate_feed_url(feed_url):
     """
     Validate if the given URL is a valid RSS feed by attempting to parse it.
 
+    Successful validations are cached, so validating the same URL again doesn't refetch it.
+
     Args:
         feed_url (str): URL to validate
 
     Returns:
-        tuple: (is_valid, feed_title) where is_valid is boolean and feed_title is the feed's title if valid
+        tuple: (is_valid, feed_title, feed) where is_valid is boolean, and feed_title and feed are
+        the feed's title and parsed data if valid
     """
     try:
-        feed = feedparser.parse(feed_url)
-        # Check if parsing was successful and contains feed data
-        if feed and hasattr(feed, 'feed') and hasattr(feed.feed, 'title'):
-            return True, feed.feed.title
-        return False, None
+        feed = _fetch_valid_feed(feed_url)
+        return True, feed.feed.title, feed
     except Exception:
-        return False, None
+        return False, None, None
 
 
-def add_feed_to_markdown(file_path, feed_url, feed_name=None):
+def add_feed_to_markdown(file_path, feed_url, feed_name=None, validated_feed=None):
     """
     Add a new RSS feed to the markdown file.
 
@@ -104,11 +443,20 @@ def add_feed_to_markdown(file_path, feed_url, feed_name=None):
         file_path (str): Path to the markdown file
         feed_url (str): URL of the RSS feed to add
         feed_name (str): Name for the feed (optional)
+        validated_feed (dict): Parsed feed from an earlier validate_feed_url call, to skip validating again (optional)
     """
-    # Validate the feed URL first
-    is_valid, feed_title = validate_feed_url(feed_url)
-    if not is_valid:
-        return False  # Not a valid RSS feed
+    # Check if this feed URL already exists, before paying for a network round trip
+    index = _scan_feeds_file(file_path)
+    if index and _normalize_feed_url(feed_url) in index['urls']:
+        return False  # Feed already exists
+
+    # Validate the feed URL first, unless the caller already has
+    if validated_feed is not None:
+        feed_title = getattr(validated_feed.feed, 'title', None)
+    else:
+        is_valid, feed_title, _ = validate_feed_url(feed_url)
+        if not is_valid:
+            return False  # Not a valid RSS feed
 
     # If no name provided, use the feed's title from the feed data, or fallback to domain
     if not feed_name:
@@ -116,85 +464,313 @@ def add_feed_to_markdown(file_path, feed_url, feed_name=None):
             feed_name = feed_title
         else:
             # Extract domain from URL as fallback
-            feed_name = feed_url.split('//')[1].split('/')[0]
+            feed_name = urllib.parse.urlsplit(feed_url).hostname or feed_url
 
-    # Ensure the file has content structure
-    if not os.path.exists(file_path):
-        content = "# RSS Feeds\n\nThis file contains the list of RSS feeds for the terminal RSS reader.\n\n## Uncategorized\n"
-    else:
+    # Add the new feed to the "Uncategorized" section
+    new_feed_line = f"- [{feed_name}]({feed_url})\n"
+
+    # Existing content is only rewritten when the file lacks the "# RSS Feeds" header, or when the
+    # "Uncategorized" section is followed by another one; otherwise the new feed (and the section,
+    # if needed) is appended
+    if index is None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(FEEDS_FILE_HEADER)
+            f.write(new_feed_line)
+    elif not index['has_header']:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
+        if not index['ends_with_newline']:
+            content += "\n"
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(FEEDS_FILE_HEADER + content)
+            f.write(new_feed_line)
+    elif index['has_uncategorized'] and not index['uncategorized_is_last']:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        # Insert after the section's last line, keeping the blank line before the next heading
+        section_end = content.find("\n## ", content.rfind("## Uncategorized"))
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content[:section_end].rstrip('\n') + '\n' + new_feed_line + content[section_end:])
+    else:
+        with open(file_path, 'a', encoding='utf-8') as f:
+            if not index['ends_with_newline']:
+                f.write("\n")
+            if not index['has_uncategorized']:
+                f.write("\n## Uncategorized\n")
+            f.write(new_feed_line)
+    _FEEDS_FILE_CACHE.pop(file_path, None)
 
-        # If there's no "Uncategorized" section, add one
-        if "## Uncategorized" not in content and "# RSS Feeds" in content:
-            content += "\n## Uncategorized\n"
-        elif "# RSS Feeds" not in content:
-            content = "# RSS Feeds\n\nThis file contains the list of RSS feeds for the terminal RSS reader.\n\n## Uncategorized\n" + content
-
-    # Add the new feed to the last section
-    new_feed_line = f"- [{feed_name}]({feed_url})\n"
-
-    # Check if this feed URL already exists in the content
-    if f"({feed_url})" in content:
-        return False  # Feed already exists
+    return True  # Feed successfully added
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-        f.write(new_feed_line)
 
-    return True  # Feed successfully added
+def _print_error(message):
+    """Print an error message, in red when colorama is available."""
+    try:
+        from colorama import Fore, Style
+    except ImportError:
+        print(message)
+    else:
+        print(f"{Fore.RED}{message}{Style.RESET_ALL}")
 
 
-def fetch_feed_entries(feed_url):
+def fetch_feed_entries(feed_url, session=None):
     """
     Fetch entries from a single RSS feed.
 
     Args:
         feed_url (str): URL of the RSS feed
+        session (requests.Session): Session to send the request with (optional, defaults to a shared session)
 
     Returns:
         dict: Parsed feed data
     """
+    session = session or _http_session()
     try:
-        feed = feedparser.parse(feed_url)
-        return feed
+        response = session.get(feed_url, headers=_conditional_headers(feed_url), timeout=SYNC_FETCH_TIMEOUT)
+        # 304 Not Modified: nothing was downloaded, reuse the previous parse
+        if response.status_code == 304 and feed_url in FEED_CACHE:
+            return FEED_CACHE[feed_url]['parsed']
+        response.raise_for_status()
+
+        feed = parse_feed(response.content)
+        return _cache_feed(feed_url, response.headers.get('ETag'), response.headers.get('Last-Modified'), feed)
     except Exception as e:
-        print(f"{Fore.RED}Error fetching feed {feed_url}: {e}{Style.RESET_ALL}")
+        _print_error(f"Error fetching feed {feed_url}: {e}")
         return None
 
 
+def strip_html(summary):
+    """
+    Convert an HTML article summary to plain text.
+
+    Args:
+        summary (str): Summary as published in the feed, possibly containing HTML
+
+    Returns:
+        str: The summary text without tags, scripts or styles, and with entities decoded
+    """
+    # Most summaries are plain text already
+    if '<' not in summary:
+        return html.unescape(summary) if '&' in summary else summary
+
+    if lxml_html is not None:
+        try:
+            doc = lxml_html.fromstring(summary)
+            for element in doc.xpath('//script|//style'):
+                element.drop_tree()
+            return doc.text_content()
+        except (ParserError, ValueError):
+            pass
+
+    return html.unescape(_HTML_TAG_RE.sub('', summary))
+
+
+# An article as the UI shows it, computed once per fetch: plain-text summary, placeholders for missing fields
+Entry = collections.namedtuple('Entry', ['title', 'published', 'link', 'summary'])
+
+
+def _truncate_summary(summary):
+    """Cut a raw summary down to MAX_SUMMARY_CHARS, without leaving half a tag at the end."""
+    if len(summary) <= MAX_SUMMARY_CHARS:
+        return summary
+
+    summary = summary[:MAX_SUMMARY_CHARS]
+    head, sep, tail = summary.rpartition('<')
+    if sep and '>' not in tail:
+        summary = head
+    return summary + '…'
+
+
+def clean_entries(feed):
+    """
+    Reduce the entries of a parsed feed to the fields the UI displays.
+
+    Args:
+        feed (dict): Parsed feed data
+
+    Returns:
+        list: Entry tuples, the summary as plain text cut to MAX_SUMMARY_CHARS, for at most
+        MAX_ARTICLES entries
+    """
+    entries = []
+    for entry in itertools.islice(feed.entries, MAX_ARTICLES):
+        summary = getattr(entry, 'summary', None) or 'No Summary'
+        entries.append(Entry(
+            title=getattr(entry, 'title', None) or 'No Title',
+            published=getattr(entry, 'published', None) or 'Unknown Date',
+            link=getattr(entry, 'link', None) or 'No Link',
+            summary=strip_html(_truncate_summary(summary)),
+        ))
+    return entries
+
+
+# Every ASCII punctuation character Markdown may treat as syntax; a backslash makes each one literal
+_MD_SPECIAL_RE = re.compile(r'([\\`*_{}\[\]()<>#+\-.!|~])')
+
+
+def _escape_markdown(text):
+    """Backslash-escape Markdown syntax so feed text is rendered exactly as written."""
+    return _MD_SPECIAL_RE.sub(r'\\\1', text)
+
+
+def article_markdown(entry, feed_title):
+    """
+    Build the Markdown shown in the article detail view.
+
+    Args:
+        entry (Entry): The article to show
+        feed_title (str): Title of the feed the article came from
+
+    Returns:
+        str: Markdown document, with the feed-supplied text escaped and the link line only
+        present when the article has a link
+    """
+    lines = [
+        f"# {_escape_markdown(entry.title)}\n",
+        f"*Feed:* {_escape_markdown(feed_title)}  ",
+        f"*Published:* {_escape_markdown(entry.published)}  ",
+    ]
+    if entry.link and entry.link != 'No Link':
+        # An angle-bracket destination may hold spaces and parentheses, but not '<', '>' or newlines
+        target = entry.link.replace('<', '%3C').replace('>', '%3E').replace('\n', '')
+        lines.append(f"[{_escape_markdown(entry.link)}](<{target}>)")
+    lines.append(f"\n{_escape_markdown(entry.summary)}")
+    return "\n".join(lines)
+
+
+async def _fetch_feed_bytes(session, semaphore, feed_url):
+    """
+    Download the raw body of a single RSS feed, retrying transient failures.
+
+    Args:
+        session (aiohttp.ClientSession): Session used for the request
+        semaphore (asyncio.Semaphore): Caps the number of requests in flight
+        feed_url (str): URL of the RSS feed
+
+    Returns:
+        tuple: (status, headers, body) of the response, or None if the feed could not be downloaded
+    """
+    import aiohttp
+
+    # Send the validators from the last fetch so unchanged feeds come back as 304
+    headers = _conditional_headers(feed_url)
+
+    for attempt in range(FETCH_RETRIES):
+        try:
+            async with semaphore:
+                async with session.get(feed_url, headers=headers) as response:
+                    if response.status < 500:
+                        # Client errors won't go away by retrying
+                        if response.status >= 400:
+                            return None
+                        return response.status, response.headers, await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+        # Exponential backoff before the next attempt: 0.5s, 1s, 2s, ...
+        if attempt < FETCH_RETRIES - 1:
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+    return None
+
+
+def _new_client_session():
+    """Create an aiohttp session for the concurrent fetcher; it must be created and closed on the same loop."""
+    import aiohttp
+
+    # Connections and DNS lookups outlive a single load, so the next refresh can reuse them
+    connector = aiohttp.TCPConnector(limit=1024, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=30)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT))
+
+
+async def _fetch_all(urls, max_concurrent_requests=MAX_CONCURRENT_REQUESTS, on_result=None, session=None):
+    """
+    Fetch and parse several RSS feeds concurrently.
+
+    Args:
+        urls (list): URLs of the RSS feeds to fetch
+        max_concurrent_requests (int): Maximum number of requests in flight at once
+        on_result (callable): Called as on_result(index, parsed) as soon as each feed is done, on the
+            parse pool so it can do CPU work of its own (optional)
+        session (aiohttp.ClientSession): Session to download with, left open afterwards (optional,
+            defaults to one that only lasts for this call)
+
+    Returns:
+        list: Parsed feed data for each URL, in the same order, or None for feeds that failed
+    """
+    if session is None:
+        async with _new_client_session() as session:
+            return await _fetch_all(urls, max_concurrent_requests, on_result, session)
+
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
+    loop = asyncio.get_running_loop()
+
+    async def fetch_one(index, url):
+        # Whatever goes wrong with one feed (bad URL, unparseable body, ...) only fails that feed
+        try:
+            response = await _fetch_feed_bytes(session, semaphore, url)
+            if response is None:
+                parsed = None
+            else:
+                status, headers, body = response
+                if status == 304 and url in FEED_CACHE:
+                    parsed = FEED_CACHE[url]['parsed']
+                else:
+                    # feedparser accepts the raw bytes and handles encoding detection itself. Parse on the
+                    # pool so this loop keeps servicing the other downloads in the meantime
+                    parsed = await loop.run_in_executor(_parse_pool(), parse_feed, body)
+                    parsed = _cache_feed(url, headers.get('ETag'), headers.get('Last-Modified'), parsed)
+
+            if on_result is not None:
+                await loop.run_in_executor(_parse_pool(), on_result, index, parsed)
+            return parsed
+        except Exception as e:
+            _print_error(f"Error fetching feed {url}: {e}")
+            return None
+
+    return await asyncio.gather(*(fetch_one(index, url) for index, url in enumerate(urls)))
+
+
 class FeedListItem(ListItem):
     """Widget to display a single feed in the sidebar."""
 
     def __init__(self, title, feed_url):
         self.feed_title = title
         self.feed_url = feed_url
+        self._label = Static(title, classes="feed-sidebar-title")
         super().__init__()
 
     def compose(self) -> ComposeResult:
-        yield Static(self.feed_title, classes="feed-sidebar-title")
+        yield self._label
 
-    def on_click(self) -> None:
-        self.app.select_feed(self.feed_title, self.feed_url)
+    def set_title(self, title):
+        """Change the displayed title without remounting the item."""
+        if title != self.feed_title:
+            self.feed_title = title
+            self._label.update(title)
+
+    async def on_click(self) -> None:
+        await self.app.select_feed(self.feed_title, self.feed_url)
 
 
 class ArticleListItem(ListItem):
     """Widget to display a single article in the articles list."""
 
-    def __init__(self, title, published, link, summary, feed_title):
-        self.title = title
-        self.published = published
-        self.link = link
-        self.summary = summary
+    def __init__(self, entry, feed_title):
+        self.entry = entry
         self.feed_title = feed_title
         super().__init__()
 
     def compose(self) -> ComposeResult:
-        yield Static(f"[bold]{self.title}[/bold]", classes="article-list-title")
-        yield Static(f"[italic]{self.published}[/italic]", classes="article-list-published")
+        # One widget per article; the text is assembled rather than parsed as markup, so brackets
+        # in titles are shown as-is
+        yield Static(
+            Content.assemble((self.entry.title, "bold"), "\n", (self.entry.published, "italic $success")),
+            classes="article-list-entry",
+        )
 
     def on_click(self) -> None:
-        self.app.select_article(self.title, self.published, self.link, self.summary, self.feed_title)
+        self.app.select_article(self.entry, self.feed_title)
 
 
 class AddFeedModal(ModalScreen):
@@ -235,7 +811,7 @@ class AddFeedModal(ModalScreen):
 
             if feed_url:
                 # Validate the feed URL first
-                is_valid, extracted_name = validate_feed_url(feed_url)
+                is_valid, extracted_name, feed = validate_feed_url(feed_url)
                 if not is_valid:
                     self.app.notify("Invalid RSS feed URL. Please provide a valid RSS feed.", severity="error")
                     return
@@ -245,7 +821,7 @@ class AddFeedModal(ModalScreen):
                     feed_name = extracted_name
 
                 # Notify the main app to add the feed
-                success = self.app.add_feed(feed_url, feed_name)
+                success = self.app.add_feed(feed_url, feed_name, validated_feed=feed)
                 if success:
                     self.app.notify("Feed added successfully!", timeout=3)
                     self.dismiss(True)
@@ -266,10 +842,17 @@ class MainGridScreen(Screen):
 
     def __init__(self):
         super().__init__()
-        self.all_feeds = {}
+        # Loaded feeds as parallel lists, indexed through url_to_index
+        self.feed_urls = []
+        self.feed_titles = []
+        self.feed_entries = []
+        self.url_to_index = {}
+        self._flush_timer = None  # Pending sidebar update for feeds that just arrived
+        self._changed_urls = set()  # Feeds whose entries changed since the last sidebar update
+        # List updates await mounts and removals; this keeps a flush and a feed selection from interleaving
+        self._lists_lock = asyncio.Lock()
         self.selected_feed_title = None
         self.selected_feed_url = None
-        self.loading_feeds = False  # Flag to prevent multiple concurrent loads
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the main screen."""
@@ -288,7 +871,7 @@ class MainGridScreen(Screen):
                     with Vertical(id="articles-list-container"):
                         yield ListView(id="articles-list")
                     with ScrollableContainer(id="article-detail"):
-                        yield Static("Select an article to view its content", id="article-placeholder", classes="article-placeholder")
+                        yield Markdown("*Select an article to view its content*", id="article-md")
 
         yield Footer()
 
@@ -297,120 +880,239 @@ class MainGridScreen(Screen):
         # Load the UI immediately, then fetch feeds in the background
         self.load_feeds_async()
 
+    class FeedLoaded(Message):
+        """Posted by the background loader each time a feed has been fetched."""
+
+        def __init__(self, feed_url, title, entries):
+            super().__init__()
+            self.feed_url = feed_url
+            self.title = title
+            self.entries = entries
+
     def load_feeds_async(self):
         """Load feeds from markdown file and update UI asynchronously."""
-        if self.loading_feeds:
-            return  # Prevent multiple simultaneous loads
+        # Load feeds from markdown file - returns (name, url) tuples
+        feed_data = extract_feeds_from_markdown('feeds.md')
 
-        self.loading_feeds = True
+        # Rebuild the sidebar straight away. Each feed keeps what is already loaded until its fresh
+        # copy arrives from the fetch below. Feeds cached by the last run show their title now; their
+        # articles are cleaned up by the worker, off the UI thread
+        urls, titles, entries = [], [], []
+        previews = []
+        for feed_name, feed_url in feed_data:
+            idx = self.url_to_index.get(feed_url)
+            if idx is not None:
+                feed_title, feed_entries = self.feed_titles[idx], self.feed_entries[idx]
+            else:
+                cached = FEED_CACHE.get(feed_url, {}).get('parsed')
+                feed_title, feed_entries = self._feed_display_title(feed_name, cached), []
+                if cached:
+                    previews.append((len(urls), cached))
+            urls.append(feed_url)
+            titles.append(feed_title)
+            entries.append(feed_entries)
+        self._set_feeds(urls, titles, entries)
+        self._schedule_flush()
+
+        self.sub_title = "Loading feeds..."
+        # Starting a new load cancels one that is still running
+        self._fetch_feeds_worker(feed_data, self.app.max_concurrent_requests, previews)
+
+    @work(exclusive=True, exit_on_error=False)
+    async def _fetch_feeds_worker(self, feed_data, max_concurrent_requests, previews):
+        """Fetch the feeds in the background, posting each one to the UI as it arrives."""
+        # The downloads are async on the app's loop, sharing the app's session; parsing and the entry
+        # clean-up below run on the parse pool. Cancelling the worker (newer load, or app exit)
+        # cancels the downloads
+        worker = get_current_worker()
+        post_lock = threading.Lock()
+        fetched = set()
+
+        def post(index, parsed, fresh):
+            feed_name, feed_url = feed_data[index]
+            feed_title, feed_entries = self._feed_display_data(feed_name, parsed)
+            with post_lock:
+                # The cached copy is cleaned up alongside the fetch; it mustn't replace a fresh one
+                if worker.is_cancelled or (not fresh and feed_url in fetched):
+                    return
+                if fresh:
+                    fetched.add(feed_url)
+                self.post_message(self.FeedLoaded(feed_url, feed_title, feed_entries))
+
+        def on_result(index, parsed):
+            # Failed feeds keep whatever the sidebar already shows for them
+            if parsed is not None:
+                post(index, parsed, fresh=True)
+
+        loop = asyncio.get_running_loop()
+        previews_done = asyncio.gather(
+            *(loop.run_in_executor(_parse_pool(), post, index, cached, False) for index, cached in previews),
+            return_exceptions=True,
+        )
+        urls = [feed_url for _, feed_url in feed_data]
+        await _fetch_all(urls, max_concurrent_requests, on_result, session=self.app.client_session())
+        await previews_done
+
+        # Persist the new validators now rather than only on exit, so a killed session keeps them. The
+        # snapshot is taken here on the loop, where feeds are cached, so the thread pickles a stable dict
+        await asyncio.to_thread(save_feed_cache, cache=dict(FEED_CACHE))
+
+    def on_main_grid_screen_feed_loaded(self, message: FeedLoaded) -> None:
+        """Store a freshly fetched feed and schedule a sidebar update."""
+        idx = self.url_to_index.get(message.feed_url)
+        if idx is None:
+            return  # Removed from feeds.md while it was being fetched
+        self.feed_titles[idx] = message.title
+        self.feed_entries[idx] = message.entries
+        self._changed_urls.add(message.feed_url)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Update the lists shortly, so a burst of changes costs one pass rather than one per feed."""
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(0.05, self._flush_feeds)
+
+    async def _flush_feeds(self):
+        """Show the feeds that changed since the last update."""
+        self._flush_timer = None
+        changed, self._changed_urls = self._changed_urls, set()
+
+        async with self._lists_lock:
+            await self._populate_feeds_list()
+            # Only the open feed's article list is on screen; others are built when selected. Read the
+            # selection after the await above, in case it changed meanwhile
+            feed_url = self.selected_feed_url
+            idx = self.url_to_index.get(feed_url)
+            if idx is not None and feed_url in changed:
+                await self._sync_list_view(
+                    self.query_one("#articles-list", ListView),
+                    self._article_items(idx),
+                    key=lambda item: item.entry,
+                )
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Clear the loading indicator once the current load has finished."""
+        if event.worker.name == "_fetch_feeds_worker" and event.state in (WorkerState.SUCCESS, WorkerState.ERROR):
+            self.sub_title = ""
+            if event.state == WorkerState.ERROR:
+                self.notify(f"Error loading feeds: {event.worker.error}", severity="error")
+
+    @staticmethod
+    def _feed_display_data(feed_name, feed_data_obj):
+        """
+        Work out what the UI shows for one feed from the markdown file.
+
+        Args:
+            feed_name (str): Name of the feed in the markdown file
+            feed_data_obj (dict): Parsed feed data, or None if the feed couldn't be loaded
+
+        Returns:
+            tuple: (title, entries)
+        """
+        if not feed_data_obj:
+            # If we couldn't fetch the feed, use the display name from markdown
+            return feed_name, []
+        return MainGridScreen._feed_display_title(feed_name, feed_data_obj), clean_entries(feed_data_obj)
+
+    @staticmethod
+    def _feed_display_title(feed_name, feed_data_obj):
+        """Work out the sidebar title for one feed; cheap enough for the UI thread, unlike its entries."""
+        if not feed_data_obj:
+            return feed_name
+        # Use the name from the markdown file, but fallback to feed title if needed
+        feed_title = getattr(feed_data_obj.feed, 'title', None) or feed_name
+        if feed_title == "Unknown Feed":
+            feed_title = feed_name
+        return feed_title
+
+    def _set_feeds(self, urls, titles, entries):
+        """Replace the loaded feeds."""
+        self.feed_urls = urls
+        self.feed_titles = titles
+        self.feed_entries = entries
+        self.url_to_index = {url: i for i, url in enumerate(urls)}
+
+    async def _populate_feeds_list(self):
+        """Bring the sidebar in line with the loaded feeds."""
+        await self._sync_list_view(
+            self.query_one("#feeds-list", ListView),
+            [FeedListItem(feed_title, feed_url) for feed_url, feed_title in zip(self.feed_urls, self.feed_titles)],
+            key=lambda item: item.feed_url,
+            update=lambda shown, item: shown.set_title(item.feed_title),
+        )
+
+    @staticmethod
+    async def _sync_list_view(list_view, items, key, update=None):
+        """
+        Make a ListView show items, mounting and removing only the ones that changed.
+
+        Args:
+            list_view (ListView): List to update
+            items (list): ListItems that should be shown, in order
+            key (callable): Identifies an item; shown items with the same key are kept
+            update (callable): Called as update(shown, item) for each kept item (optional)
+        """
+        shown = list(list_view.children)
+        shown_keys = [key(child) for child in shown]
+        item_keys = [key(item) for item in items]
+        position = {k: i for i, k in enumerate(shown_keys)}
+        wanted = set(item_keys)
+
+        # Repeated keys or reordered items can't be matched up reliably; just start over
+        if (len(position) != len(shown) or len(wanted) != len(items)
+                or [k for k in shown_keys if k in wanted] != [k for k in item_keys if k in position]):
+            await list_view.clear()
+            await list_view.extend(items)
+            return
+
+        highlighted = list_view.highlighted_child
+        gone = [i for i, k in enumerate(shown_keys) if k not in wanted]
+        if gone:
+            await list_view.remove_items(gone)
+
+        # Everything before i is in its final place, so each run of new items goes in at i
+        kept_after = len(shown) - len(gone)
+        i = 0
+        while i < len(items):
+            if item_keys[i] in position:
+                if update is not None:
+                    update(shown[position[item_keys[i]]], items[i])
+                kept_after -= 1
+                i += 1
+                continue
+            start = i
+            while i < len(items) and item_keys[i] not in position:
+                i += 1
+            if kept_after:
+                await list_view.insert(start, items[start:i])
+            else:
+                await list_view.extend(items[start:i])
 
-        # Show loading message in the feeds list
-        feeds_list = self.query_one("#feeds-list", ListView)
-        loading_item = ListItem(Static("Loading feeds...", classes="loading-text"))
-        feeds_list.clear()
-        feeds_list.append(loading_item)
+        # Inserting above the highlighted item would otherwise move the highlight onto another one
+        if highlighted is not None and highlighted in list_view.children:
+            list_view.index = list_view.children.index(highlighted)
 
-        # Load feeds from markdown file - returns (name, url) tuples
-        feed_data = extract_feeds_from_markdown('feeds.md')
+    def _article_items(self, idx):
+        """Build the article list items for the feed at idx."""
+        feed_title = self.feed_titles[idx]
+        # Entries were already cleaned up by the background loader
+        return [ArticleListItem(entry, feed_title) for entry in self.feed_entries[idx]]
 
-        # Use asyncio with thread executor to run in background and update UI
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        import threading
-
-        def fetch_feeds_in_thread():
-            """Function to fetch feeds in a background thread."""
-            feeds_data = {}
-            for feed_name, feed_url in feed_data:
-                try:
-                    feed_data_obj = fetch_feed_entries(feed_url)
-                    if feed_data_obj:
-                        # Use the name from the markdown file, but fallback to feed title if needed
-                        feed_title = getattr(feed_data_obj.feed, 'title', feed_name)
-                        if feed_title == "Unknown Feed":
-                            feed_title = feed_name
-                        feeds_data[feed_url] = {
-                            'title': feed_title,
-                            'data': feed_data_obj,
-                            'display_name': feed_name  # Store the name from markdown
-                        }
-                    else:
-                        # If we couldn't fetch the feed, use the display name from markdown
-                        feeds_data[feed_url] = {
-                            'title': feed_name,
-                            'data': None,
-                            'display_name': feed_name
-                        }
-                except Exception:
-                    # If there's an error, use the display name from markdown
-                    feeds_data[feed_url] = {
-                        'title': feed_name,
-                        'data': None,
-                        'display_name': feed_name
-                    }
-
-            # Schedule UI update on the main thread
-            self.app.call_later(self._update_feeds_ui, feeds_data)
-
-        # Run the function in a separate thread
-        thread = threading.Thread(target=fetch_feeds_in_thread, daemon=True)
-        thread.start()
-
-    def _on_feeds_loaded(self, result):
-        """Handle the result of the feed loading worker."""
-        # Update UI in the main thread with the result
-        self._update_feeds_ui(result.value)
-
-    def _update_feeds_ui(self, feeds_data):
-        """Update the feeds UI with loaded data."""
-        # Update UI in the main thread
-        self.all_feeds = feeds_data
-
-        # Update the UI with the feed list
-        feeds_list = self.query_one("#feeds-list", ListView)
-        feeds_list.clear()
-        for feed_url, feed_info in self.all_feeds.items():
-            feed_item = FeedListItem(feed_info['title'], feed_url)
-            feeds_list.append(feed_item)
-
-        self.loading_feeds = False
-
-    def show_articles_for_feed(self, feed_url):
+    async def show_articles_for_feed(self, feed_url):
         """Display articles for the selected feed."""
-        if feed_url in self.all_feeds:
-            feed_data = self.all_feeds[feed_url]['data']
-            articles_list = self.query_one("#articles-list", ListView)
-            articles_list.clear()
-
-            # Show loading message while populating articles
-            articles_list.append(ListItem(Static("Loading articles...", classes="loading-text")))
-
-            # Clear and repopulate with actual articles
-            articles_list.clear()
-            for entry in feed_data.entries:
-                title = getattr(entry, 'title', 'No Title')
-                published = getattr(entry, 'published', 'Unknown Date')
-                link = getattr(entry, 'link', 'No Link')
-                summary = getattr(entry, 'summary', 'No Summary')
-                # Clean up HTML from summary
-                clean_summary = re.sub('<[^<]+?>', '', summary)
-
-                article_item = ArticleListItem(title, published, link, clean_summary, self.all_feeds[feed_url]['title'])
-                articles_list.append(article_item)
-
-    def show_article_detail(self, title, published, link, summary, feed_title):
+        async with self._lists_lock:
+            # A later selection may have been made while this one waited for the lock
+            idx = self.url_to_index.get(feed_url)
+            if idx is not None and feed_url == self.selected_feed_url:
+                articles_list = self.query_one("#articles-list", ListView)
+                await articles_list.clear()
+                # One mount for the whole list rather than a refresh per item
+                await articles_list.extend(self._article_items(idx))
+
+    def show_article_detail(self, entry, feed_title):
         """Display the selected article in the detail view."""
-        detail_container = self.query_one("#article-detail", ScrollableContainer)
-
-        # Clear previous content
-        detail_container.query('*').remove()
-
-        # Add new article content
-        detail_container.mount(Static(f"[bold]{title}[/bold]", classes="selected-article-title"))
-        detail_container.mount(Static(f"Feed: {feed_title}", classes="selected-article-feed"))
-        detail_container.mount(Static(f"Published: {published}", classes="selected-article-published"))
-        detail_container.mount(Static(f"Link: {link}", classes="selected-article-link"))
-        detail_container.mount(Static("\n" + summary, classes="selected-article-summary"))
+        # One Markdown update instead of tearing down and re-mounting a widget per field
+        self.query_one("#article-md", Markdown).update(article_markdown(entry, feed_title))
 
 
 class TextualRSSReaderApp(App):
@@ -428,33 +1130,49 @@ class TextualRSSReaderApp(App):
     # Reactive state
     current_view = reactive("main")
 
-    def __init__(self):
+    def __init__(self, max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS):
         super().__init__()
+        self.max_concurrent_requests = max_concurrent_requests
         self.main_screen = MainGridScreen()
+        self._refresh_timer = None  # Pending refresh, so repeated key presses start a single load
+        self._client_session = None  # aiohttp session shared by every load, created on first use
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
         self.title = "Textual RSS Reader"
+        load_feed_cache()
         self.push_screen(self.main_screen)
 
+    async def on_unmount(self) -> None:
+        """Called when the app exits."""
+        save_feed_cache()
+        if self._client_session is not None:
+            await self._client_session.close()
+
+    def client_session(self):
+        """Return the aiohttp session feeds are fetched with, so connections are reused across refreshes."""
+        if self._client_session is None:
+            self._client_session = _new_client_session()
+        return self._client_session
+
     def load_feeds(self):
-        """Load feeds on the current screen."""
-        if hasattr(self.screen, 'load_feeds'):
-            self.screen.load_feeds()
+        """Reload feeds on the main screen."""
+        # The add-feed modal may still be on top when this runs, so don't go through self.screen
+        self.main_screen.load_feeds_async()
 
-    def select_feed(self, feed_title: str, feed_url: str):
+    async def select_feed(self, feed_title: str, feed_url: str):
         """Handle feed selection from the sidebar."""
         self.main_screen.selected_feed_title = feed_title
         self.main_screen.selected_feed_url = feed_url
-        self.main_screen.show_articles_for_feed(feed_url)
+        await self.main_screen.show_articles_for_feed(feed_url)
 
-    def select_article(self, title: str, published: str, link: str, summary: str, feed_title: str):
+    def select_article(self, entry: Entry, feed_title: str):
         """Handle article selection from the articles list."""
-        self.main_screen.show_article_detail(title, published, link, summary, feed_title)
+        self.main_screen.show_article_detail(entry, feed_title)
 
-    def add_feed(self, feed_url: str, feed_name: str = None) -> bool:
+    def add_feed(self, feed_url: str, feed_name: str = None, validated_feed=None) -> bool:
         """Add a new feed to the markdown file."""
-        success = add_feed_to_markdown('feeds.md', feed_url, feed_name)
+        success = add_feed_to_markdown('feeds.md', feed_url, feed_name, validated_feed=validated_feed)
         if success:
             self.notify("Feed added successfully!", timeout=3)
             # Reload the feeds display
@@ -470,14 +1188,20 @@ class TextualRSSReaderApp(App):
 
     def action_refresh(self) -> None:
         """Action to refresh the feeds."""
-        self.notify("Refreshing feeds...", timeout=2)
-        self.load_feeds()
+        if self._refresh_timer is None:
+            self.notify("Refreshing feeds...", timeout=2)
+            self._refresh_timer = self.set_timer(0.05, self._flush_refresh)
 
     def action_show_main(self) -> None:
         """Action to show the main feeds view."""
         # If we're on the main screen, just refresh
-        if isinstance(self.screen, MainGridScreen):
-            self.load_feeds()
+        if isinstance(self.screen, MainGridScreen) and self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(0.05, self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run the refresh requested by the latest burst of key presses."""
+        self._refresh_timer = None
+        self.load_feeds()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
+import asyncio
+import concurrent.futures
 import unittest
 import tempfile
 import os
 from unittest.mock import patch, MagicMock
 import sys
 
+# Tests that mock or bypass feedparser.parse need the pure-Python parser even when feedparser-rs is installed
+import feedparser
+
 # Add the current directory to the path so we can import rss_reader
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import rss_reader
@@ -15,6 +20,8 @@ class TestRSSReader(unittest.TestCase):
         # Create a temporary markdown file for testing
         self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md')
         self.temp_file.close()
+        rss_reader.FEED_CACHE.clear()
+        rss_reader._PARSE_CACHE.clear()
 
     def tearDown(self):
         """Tear down test fixtures after each test method."""
@@ -59,11 +66,44 @@ class TestRSSReader(unittest.TestCase):
         self.assertIn("TechCrunch", feed_names)
         self.assertIn("BBC News", feed_names)
 
+    def test_extract_feeds_from_markdown_rereads_changed_file(self):
+        """Test that the cached feed list is refreshed when the file changes."""
+        with open(self.temp_file.name, 'w') as f:
+            f.write("- [Hacker News](https://news.ycombinator.com/rss)\n")
+
+        self.assertEqual(len(rss_reader.extract_feeds_from_markdown(self.temp_file.name)), 1)
+
+        with open(self.temp_file.name, 'a') as f:
+            f.write("- [TechCrunch](https://techcrunch.com/feed/)\n")
+
+        self.assertEqual(len(rss_reader.extract_feeds_from_markdown(self.temp_file.name)), 2)
+
+    def test_extract_feeds_from_markdown_skips_non_feed_links(self):
+        """Test that links which don't look like feeds are ignored."""
+        markdown_content = """
+- [Real Python](https://realpython.com/atom.xml)
+- [BBC Homepage](https://www.bbc.co.uk)
+- [Python Weekly](https://us19.campaign-archive.com/feed?u=1a6a8c70a9e4a8f60a0a49a13)
+"""
+        with open(self.temp_file.name, 'w') as f:
+            f.write(markdown_content)
+
+        feeds = rss_reader.extract_feeds_from_markdown(self.temp_file.name)
+        self.assertEqual([feed[0] for feed in feeds], ["Real Python", "Python Weekly"])
+
+    def test_extract_feeds_from_markdown_keeps_malformed_links(self):
+        """Test that a link urlsplit can't parse is still listed rather than breaking the scan."""
+        with open(self.temp_file.name, 'w') as f:
+            f.write("- [A](https://example.com/rss)\n- [B](http://[oops/rss)\n")
+
+        feeds = rss_reader.extract_feeds_from_markdown(self.temp_file.name)
+        self.assertEqual(feeds, [("A", "https://example.com/rss"), ("B", "http://[oops/rss")])
+
     @patch('rss_reader.validate_feed_url')
     def test_add_feed_to_markdown_new_feed(self, mock_validate):
         """Test adding a new feed to the markdown file."""
         # Mock the validation to return True
-        mock_validate.return_value = (True, "Example Feed")
+        mock_validate.return_value = (True, "Example Feed", MagicMock())
 
         # Create a basic markdown file
         with open(self.temp_file.name, 'w') as f:
@@ -82,11 +122,26 @@ class TestRSSReader(unittest.TestCase):
         self.assertIn("Example Feed", content)
         self.assertIn("https://example.com/rss", content)
 
+    @patch('rss_reader.validate_feed_url')
+    def test_add_feed_to_markdown_names_feed_after_host(self, mock_validate):
+        """Test that a feed without a usable title is named after its host."""
+        mock_validate.return_value = (True, "Unknown Feed", MagicMock())
+
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# RSS Feeds\n\n## Uncategorized\n")
+
+        self.assertTrue(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://user:pw@Example.com:8443/rss"))
+
+        with open(self.temp_file.name, 'r') as f:
+            content = f.read()
+
+        self.assertTrue(content.endswith("- [example.com](https://user:pw@Example.com:8443/rss)\n"))
+
     @patch('rss_reader.validate_feed_url')
     def test_add_feed_to_markdown_duplicate_prevention(self, mock_validate):
         """Test that duplicate feeds are not added."""
         # Mock the validation to return True
-        mock_validate.return_value = (True, "Example Feed")
+        mock_validate.return_value = (True, "Example Feed", MagicMock())
 
         # Create a markdown file with an existing feed
         with open(self.temp_file.name, 'w') as f:
@@ -98,11 +153,90 @@ class TestRSSReader(unittest.TestCase):
         # Function should return False for duplicate
         self.assertFalse(result)
 
+        # The same URL with a different host case or a trailing slash is still a duplicate
+        self.assertFalse(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://Example.com/rss/", "Example Feed"))
+        mock_validate.assert_not_called()
+
+    @patch('rss_reader.validate_feed_url')
+    def test_add_feed_to_markdown_adds_missing_sections(self, mock_validate):
+        """Test that the header and Uncategorized section are added only when missing."""
+        mock_validate.return_value = (True, "Example Feed", MagicMock())
+
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# RSS Feeds\n\n## News\n- [BBC News](https://feeds.bbci.co.uk/news/rss.xml)\n")
+
+        self.assertTrue(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://example.com/rss", "Example Feed"))
+        self.assertTrue(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://example.com/atom.xml", "Other Feed"))
+
+        with open(self.temp_file.name, 'r') as f:
+            content = f.read()
+
+        self.assertEqual(content, "# RSS Feeds\n\n## News\n- [BBC News](https://feeds.bbci.co.uk/news/rss.xml)\n"
+                                  "\n## Uncategorized\n- [Example Feed](https://example.com/rss)\n"
+                                  "- [Other Feed](https://example.com/atom.xml)\n")
+
+        # A file without the header gets one prepended
+        with open(self.temp_file.name, 'w') as f:
+            f.write("- [BBC News](https://feeds.bbci.co.uk/news/rss.xml)\n")
+
+        self.assertTrue(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://example.com/rss", "Example Feed"))
+
+        with open(self.temp_file.name, 'r') as f:
+            content = f.read()
+
+        self.assertTrue(content.startswith(rss_reader.FEEDS_FILE_HEADER))
+        self.assertTrue(content.endswith("- [BBC News](https://feeds.bbci.co.uk/news/rss.xml)\n"
+                                         "- [Example Feed](https://example.com/rss)\n"))
+
+    @patch('rss_reader.validate_feed_url')
+    def test_add_feed_to_markdown_keeps_feeds_in_uncategorized(self, mock_validate):
+        """Test that new feeds go to the Uncategorized section even when it isn't the last one."""
+        mock_validate.return_value = (True, "Example Feed", MagicMock())
+
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# RSS Feeds\n\n## Uncategorized\n- [A](https://a.example.com/rss)\n\n"
+                    "## News\n- [BBC News](https://feeds.bbci.co.uk/news/rss.xml)")
+
+        self.assertTrue(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://example.com/rss", "Example Feed"))
+
+        with open(self.temp_file.name, 'r') as f:
+            content = f.read()
+
+        self.assertEqual(content, "# RSS Feeds\n\n## Uncategorized\n- [A](https://a.example.com/rss)\n"
+                                  "- [Example Feed](https://example.com/rss)\n\n"
+                                  "## News\n- [BBC News](https://feeds.bbci.co.uk/news/rss.xml)")
+
+        # Appending to a file without a trailing newline starts a new line first
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# RSS Feeds\n\n## Uncategorized\n- [A](https://a.example.com/rss)")
+
+        self.assertTrue(rss_reader.add_feed_to_markdown(self.temp_file.name, "https://example.com/rss", "Example Feed"))
+
+        with open(self.temp_file.name, 'r') as f:
+            content = f.read()
+
+        self.assertEqual(content, "# RSS Feeds\n\n## Uncategorized\n- [A](https://a.example.com/rss)\n"
+                                  "- [Example Feed](https://example.com/rss)\n")
+
+    @patch('rss_reader.validate_feed_url')
+    def test_add_feed_to_markdown_reuses_validated_feed(self, mock_validate):
+        """Test that a feed validated by the caller isn't validated (fetched) again."""
+        validated_feed = MagicMock()
+        validated_feed.feed.title = "Example Feed"
+
+        result = rss_reader.add_feed_to_markdown(self.temp_file.name, "https://example.com/rss",
+                                                 validated_feed=validated_feed)
+
+        self.assertTrue(result)
+        mock_validate.assert_not_called()
+        with open(self.temp_file.name, 'r') as f:
+            self.assertIn("- [Example Feed](https://example.com/rss)", f.read())
+
     @patch('rss_reader.validate_feed_url')
     def test_add_feed_to_markdown_file_creation(self, mock_validate):
         """Test adding a feed to a file that doesn't exist (should create it)."""
         # Mock the validation to return True
-        mock_validate.return_value = (True, "Example Feed")
+        mock_validate.return_value = (True, "Example Feed", MagicMock())
 
         non_existent_file = "/tmp/test_non_existent_feeds.md"
 
@@ -125,9 +259,13 @@ class TestRSSReader(unittest.TestCase):
         # Clean up
         os.remove(non_existent_file)
 
+    @patch('rss_reader._get_feedparser', lambda: feedparser)
+    @patch('rss_reader.lxml_etree', None)
+    @patch('rss_reader._http_session')
     @patch('feedparser.parse')
-    def test_fetch_feed_entries_success(self, mock_parse):
+    def test_fetch_feed_entries_success(self, mock_parse, mock_http_session):
         """Test fetching entries from a valid RSS feed."""
+        mock_http_session.return_value.get.return_value = MagicMock(status_code=200, headers={}, content=b"<rss/>")
         mock_feed = MagicMock()
         mock_feed.entries = [
             MagicMock(title="Test Entry 1", published="2023-01-01", link="http://example.com/1", summary="Summary 1"),
@@ -141,16 +279,353 @@ class TestRSSReader(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(len(result.entries), 2)
         self.assertEqual(result.feed.title, "Test Feed")
+        mock_parse.assert_called_once_with(b"<rss/>")
 
-    @patch('feedparser.parse')
-    def test_fetch_feed_entries_failure(self, mock_parse):
+    @patch('rss_reader._http_session')
+    def test_fetch_feed_entries_failure(self, mock_http_session):
         """Test handling of feed fetching errors."""
-        mock_parse.side_effect = Exception("Network error")
+        mock_http_session.return_value.get.side_effect = Exception("Network error")
 
         result = rss_reader.fetch_feed_entries("https://example.com/bad_rss")
 
         self.assertIsNone(result)
 
+    @patch('rss_reader._get_feedparser', lambda: feedparser)
+    @patch('rss_reader.lxml_etree', None)
+    @patch('feedparser.parse')
+    def test_parse_feed_memoizes_identical_bodies(self, mock_parse):
+        """Test that parsing the same body twice only runs the parser once."""
+        mock_parse.side_effect = lambda source: MagicMock()
+
+        first = rss_reader.parse_feed(b"<rss><channel><title>Feed</title></channel></rss>")
+        second = rss_reader.parse_feed(b"<rss><channel><title>Feed</title></channel></rss>")
+        other = rss_reader.parse_feed(b"<rss><channel><title>Other</title></channel></rss>")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(mock_parse.call_count, 2)
+
+    @patch('rss_reader.lxml_etree', None)
+    @patch('rss_reader.MAX_ARTICLES', 2)
+    def test_parse_feed_keeps_only_displayed_entries(self):
+        """Test that feedparser results are trimmed to the entries the article list can show."""
+        items = b"".join(b"<item><title>Item %d</title></item>" % i for i in range(5))
+        feed = rss_reader.parse_feed(b"<rss><channel><title>Feed</title>" + items + b"</channel></rss>")
+
+        self.assertEqual([entry.title for entry in feed.entries], ["Item 0", "Item 1"])
+
+    @unittest.skipUnless(rss_reader.lxml_etree, "lxml is not installed")
+    @patch('rss_reader._get_feedparser', lambda: feedparser)
+    def test_parse_feed_fast_path(self):
+        """Test that well-formed RSS and Atom bodies are parsed by lxml, and anything else by feedparser."""
+        rss = rss_reader.parse_feed(
+            b'<?xml version="1.0"?><rss><channel><title>Feed</title>'
+            b'<item><title>First</title><link>http://example.com/1</link><pubDate>2023-01-01</pubDate>'
+            b'<description>&lt;b&gt;One&lt;/b&gt;</description></item></channel></rss>'
+        )
+        self.assertEqual(rss.feed.title, "Feed")
+        self.assertEqual(rss.entries[0]._asdict(), {
+            'title': 'First', 'link': 'http://example.com/1', 'published': '2023-01-01', 'summary': '<b>One</b>'
+        })
+
+        # Without a <link>, a permalink guid is the article's link, as feedparser does it
+        guids = rss_reader.parse_feed(
+            b'<rss><channel><title>Feed</title>'
+            b'<item><guid>http://example.com/g1</guid></item>'
+            b'<item><guid isPermaLink="false">tag:example.com,2023:2</guid></item>'
+            b'<item><link>http://example.com/3</link><guid>http://example.com/g3</guid></item>'
+            b'</channel></rss>'
+        )
+        self.assertEqual([entry.link for entry in guids.entries],
+                         ["http://example.com/g1", None, "http://example.com/3"])
+
+        atom = rss_reader.parse_feed(
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>'
+            b'<entry><title>A</title><link rel="alternate" href="http://example.com/a"/>'
+            b'<updated>2023-01-02</updated><content>Plain</content></entry></feed>'
+        )
+        self.assertEqual(atom.feed.title, "Atom")
+        self.assertEqual((atom.entries[0].link, atom.entries[0].published, atom.entries[0].summary),
+                         ("http://example.com/a", "2023-01-02", "Plain"))
+
+        with patch('feedparser.parse') as mock_parse:
+            rss_reader.parse_feed(b"<html><body>Not a feed</body></html>")
+            rss_reader.parse_feed(b"<rss><channel><title>Broken &nbsp;</title></channel></rss>")
+            self.assertEqual(mock_parse.call_count, 2)
+
+    @patch('feedparser.parse')
+    def test_fetch_feed_entries_not_modified(self, mock_parse):
+        """Test that a 304 response reuses the cached feed and sends the stored validators."""
+        cached_feed = MagicMock()
+        rss_reader.FEED_CACHE["https://example.com/rss"] = {
+            'etag': '"abc"', 'modified': None, 'parsed': cached_feed
+        }
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=304)
+
+        result = rss_reader.fetch_feed_entries("https://example.com/rss", session=session)
+
+        self.assertIs(result, cached_feed)
+        self.assertEqual(session.get.call_args.kwargs['headers'], {'If-None-Match': '"abc"'})
+        mock_parse.assert_not_called()
+
+    def test_feed_cache_round_trips_through_disk(self):
+        """Test that saved validators are loaded back and no temporary file is left behind."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_file = os.path.join(cache_dir, "feeds.pkl")
+            rss_reader.FEED_CACHE["https://example.com/rss"] = {'etag': '"abc"', 'modified': None, 'parsed': None}
+
+            rss_reader.save_feed_cache(cache_file)
+            rss_reader.FEED_CACHE.clear()
+            rss_reader.load_feed_cache(cache_file)
+
+            self.assertEqual(rss_reader.FEED_CACHE["https://example.com/rss"]['etag'], '"abc"')
+            self.assertEqual(os.listdir(cache_dir), ["feeds.pkl"])
+
+    def test_feed_cache_snapshot_saves_while_cache_changes(self):
+        """Test that a snapshot still saves when FEED_CACHE gains feeds in the middle of pickling."""
+        class AddsFeedWhenPickled:
+            def __reduce__(self):
+                # Stands in for the event loop caching another feed while the save thread runs
+                rss_reader.FEED_CACHE[f"https://example.com/{len(rss_reader.FEED_CACHE)}"] = {}
+                return (str, ("parsed",))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_file = os.path.join(cache_dir, "feeds.pkl")
+            rss_reader.FEED_CACHE["https://example.com/rss"] = {
+                'etag': '"abc"', 'modified': None, 'parsed': AddsFeedWhenPickled()
+            }
+            rss_reader.FEED_CACHE["https://example.com/atom"] = {'etag': None, 'modified': None, 'parsed': None}
+
+            rss_reader.save_feed_cache(cache_file, cache=dict(rss_reader.FEED_CACHE))
+            rss_reader.FEED_CACHE.clear()
+            rss_reader.load_feed_cache(cache_file)
+
+            self.assertEqual(list(rss_reader.FEED_CACHE), ["https://example.com/rss", "https://example.com/atom"])
+            self.assertEqual(rss_reader.FEED_CACHE["https://example.com/rss"]['parsed'], "parsed")
+
+    def test_concurrent_feed_cache_saves_dont_collide(self):
+        """Test that overlapping saves each use their own temporary file and leave a loadable cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_file = os.path.join(cache_dir, "feeds.pkl")
+            rss_reader.FEED_CACHE["https://example.com/rss"] = {'etag': '"abc"', 'modified': None, 'parsed': None}
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: rss_reader.save_feed_cache(cache_file), range(32)))
+            rss_reader.FEED_CACHE.clear()
+            rss_reader.load_feed_cache(cache_file)
+
+            self.assertEqual(rss_reader.FEED_CACHE["https://example.com/rss"]['etag'], '"abc"')
+            self.assertEqual(os.listdir(cache_dir), ["feeds.pkl"])
+
+    def test_clean_entries_strips_html_and_fills_defaults(self):
+        """Test that parsed entries are reduced to display fields with HTML removed."""
+        feed = MagicMock()
+        feed.entries = [
+            MagicMock(title="Entry", published="2023-01-01", link="http://example.com/1", summary="<p>Hello <b>world</b></p>"),
+            MagicMock(spec=[]),
+        ]
+
+        entries = rss_reader.clean_entries(feed)
+
+        self.assertEqual(entries[0], rss_reader.Entry(
+            title="Entry", published="2023-01-01", link="http://example.com/1", summary="Hello world"
+        ))
+        self.assertEqual(entries[1], rss_reader.Entry(
+            title="No Title", published="Unknown Date", link="No Link", summary="No Summary"
+        ))
+
+    def test_article_markdown_escapes_feed_text(self):
+        """Test that Markdown syntax in feed fields is shown literally and a real link is kept."""
+        entry = rss_reader.Entry(
+            title="*Big* #1 [news]", published="2023-01-01", link="http://example.com/a_(b)", summary="# Not a heading"
+        )
+
+        md = rss_reader.article_markdown(entry, "Feed_name")
+
+        self.assertIn("# \\*Big\\* \\#1 \\[news\\]\n", md)
+        self.assertIn("*Feed:* Feed\\_name", md)
+        self.assertIn("](<http://example.com/a_(b)>)", md)
+        self.assertIn("\\# Not a heading", md)
+
+    def test_article_markdown_omits_missing_link(self):
+        """Test that an article without a link gets no link line."""
+        entry = rss_reader.Entry(title="Entry", published="Unknown Date", link="No Link", summary="No Summary")
+
+        md = rss_reader.article_markdown(entry, "Feed")
+
+        self.assertNotIn("No Link", md)
+        self.assertNotIn("](", md)
+
+    def test_clean_entries_caps_article_count(self):
+        """Test that only the first MAX_ARTICLES entries are kept."""
+        feed = MagicMock()
+        feed.entries = [MagicMock(title=f"Entry {i}", summary="") for i in range(rss_reader.MAX_ARTICLES + 50)]
+
+        entries = rss_reader.clean_entries(feed)
+
+        self.assertEqual(len(entries), rss_reader.MAX_ARTICLES)
+        self.assertEqual(entries[0].title, "Entry 0")
+
+    @patch('rss_reader.MAX_SUMMARY_CHARS', 10)
+    def test_clean_entries_truncates_long_summaries(self):
+        """Test that long summaries are cut before stripping, dropping a tag split by the cut."""
+        feed = MagicMock()
+        feed.entries = [MagicMock(summary="short"), MagicMock(summary="<b>Hello</b> world")]
+
+        entries = rss_reader.clean_entries(feed)
+
+        self.assertEqual(entries[0].summary, "short")
+        self.assertEqual(entries[1].summary, "Hello…")
+
+    def test_strip_html(self):
+        """Test converting HTML summaries to plain text, with and without lxml."""
+        for lxml_html in (rss_reader.lxml_html, None):
+            with patch('rss_reader.lxml_html', lxml_html):
+                self.assertEqual(rss_reader.strip_html("Plain text"), "Plain text")
+                self.assertEqual(rss_reader.strip_html("Fish &amp; chips"), "Fish & chips")
+                self.assertEqual(rss_reader.strip_html("<p>Fish &amp; <i>chips</i></p>"), "Fish & chips")
+
+    @patch('rss_reader.lxml_html', None)
+    def test_strip_html_regex_fallback_handles_stray_brackets(self):
+        """Test that unclosed '<' characters are kept as text rather than swallowing the summary."""
+        self.assertEqual(rss_reader.strip_html("a < b and <i>c</i> > d"), "a < b and c > d")
+        self.assertEqual(rss_reader.strip_html("<" * 50000), "<" * 50000)
+
+    @unittest.skipUnless(rss_reader.lxml_html, "lxml is not installed")
+    def test_strip_html_drops_scripts(self):
+        """Test that script contents don't leak into the summary text."""
+        self.assertEqual(rss_reader.strip_html("<p>Hi</p><script>alert(1)</script>"), "Hi")
+
+    @patch('rss_reader._fetch_feed_bytes')
+    def test_fetch_all_preserves_order_and_failures(self, mock_fetch_bytes):
+        """Test that concurrent fetching keeps URL order and marks failed feeds as None."""
+        bodies = {
+            "https://example.com/a.xml": b"<rss><channel><title>Feed A</title></channel></rss>",
+            "https://example.com/b.xml": None,
+        }
+
+        async def fake_fetch(session, semaphore, feed_url):
+            body = bodies[feed_url]
+            return (200, {}, body) if body is not None else None
+
+        mock_fetch_bytes.side_effect = fake_fetch
+
+        results = asyncio.run(rss_reader._fetch_all(list(bodies)))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].feed.title, "Feed A")
+        self.assertIsNone(results[1])
+
+    @patch('rss_reader._print_error')
+    @patch('rss_reader._fetch_feed_bytes')
+    def test_fetch_all_isolates_unexpected_errors(self, mock_fetch_bytes, mock_print_error):
+        """Test that an unexpected error in one feed's download or parse only fails that feed."""
+        good = b"<rss><channel><title>Good</title></channel></rss>"
+
+        async def fake_fetch(session, semaphore, feed_url):
+            if feed_url.endswith("bad-url.xml"):
+                raise UnicodeError("label empty or too long")
+            return 200, {}, good if feed_url.endswith("good.xml") else b"bad body"
+
+        def fake_parse(body):
+            if body != good:
+                raise ValueError("unparseable")
+            return MagicMock(feed=MagicMock(title="Good"))
+
+        mock_fetch_bytes.side_effect = fake_fetch
+        urls = ["https://example.com/bad-url.xml", "https://example.com/good.xml", "https://example.com/bad-body.xml"]
+        with patch('rss_reader.parse_feed', side_effect=fake_parse):
+            results = asyncio.run(rss_reader._fetch_all(urls))
+
+        self.assertIsNone(results[0])
+        self.assertEqual(results[1].feed.title, "Good")
+        self.assertIsNone(results[2])
+        self.assertEqual(mock_print_error.call_count, 2)
+
+    @patch('rss_reader._fetch_feed_bytes')
+    def test_fetch_all_limits_concurrent_requests(self, mock_fetch_bytes):
+        """Test that no more than max_concurrent_requests downloads run at once."""
+        in_flight = []
+        peak = []
+
+        async def fake_fetch(session, semaphore, feed_url):
+            async with semaphore:
+                in_flight.append(feed_url)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(feed_url)
+            return None
+
+        mock_fetch_bytes.side_effect = fake_fetch
+
+        urls = [f"https://example.com/{i}.xml" for i in range(10)]
+        asyncio.run(rss_reader._fetch_all(urls, max_concurrent_requests=3))
+
+        self.assertEqual(max(peak), 3)
+
+    @patch('rss_reader._fetch_feed_bytes')
+    def test_fetch_all_reports_each_feed_as_it_completes(self, mock_fetch_bytes):
+        """Test that on_result is called for every feed in completion order, not URL order."""
+        delays = {"https://example.com/slow.xml": 0.05, "https://example.com/fast.xml": 0}
+
+        async def fake_fetch(session, semaphore, feed_url):
+            await asyncio.sleep(delays[feed_url])
+            return None
+
+        mock_fetch_bytes.side_effect = fake_fetch
+
+        reported = []
+        asyncio.run(rss_reader._fetch_all(list(delays), on_result=lambda i, parsed: reported.append((i, parsed))))
+
+        self.assertEqual(reported, [(1, None), (0, None)])
+
+    def test_sync_list_view_mounts_only_changes(self):
+        """Test that list updates insert and remove only changed items, keep the highlight, and rebuild on reorder."""
+        from textual.app import App
+        from textual.widgets import ListView
+
+        class ListApp(App):
+            def compose(self):
+                yield ListView()
+
+        def items(*urls):
+            return [rss_reader.FeedListItem(url.upper(), url) for url in urls]
+
+        async def run():
+            app = ListApp()
+            async with app.run_test():
+                list_view = app.query_one(ListView)
+
+                async def sync(wanted):
+                    await rss_reader.MainGridScreen._sync_list_view(
+                        list_view, wanted, key=lambda item: item.feed_url,
+                        update=lambda shown, item: shown.set_title(item.feed_title),
+                    )
+                    return [child.feed_url for child in list_view.children]
+
+                await sync(items("a", "c"))
+                a, c = list_view.children
+                list_view.index = 1
+
+                # New items go in before, between and after the kept ones, which stay mounted
+                self.assertEqual(await sync(items("x", "a", "b", "c", "d")), ["x", "a", "b", "c", "d"])
+                self.assertIs(list_view.children[1], a)
+                self.assertIs(list_view.children[3], c)
+                self.assertIs(list_view.highlighted_child, c)
+
+                # Removed items go, and kept ones get their new title in place
+                self.assertEqual(await sync([rss_reader.FeedListItem("Renamed", "a"), *items("c")]), ["a", "c"])
+                self.assertEqual((list_view.children[0], list_view.children[1]), (a, c))
+                self.assertEqual(a.feed_title, "Renamed")
+                self.assertIs(list_view.highlighted_child, c)
+
+                # A reorder can't be patched up, so the list is rebuilt
+                self.assertEqual(await sync(items("c", "a")), ["c", "a"])
+                self.assertIsNot(list_view.children[0], c)
+
+        asyncio.run(run())
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file